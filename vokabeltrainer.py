@@ -1,66 +1,321 @@
+from __future__ import annotations
+
+import atexit
+import heapq
 import json
 import random
 import os
+import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from types import MappingProxyType
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 FILE_VOCABLES = "vokabeln.json"
 FILE_SCORES = "scores.json"
-FILE_SESSIONS = "sessions.json"
+FILE_SESSIONS = "sessions.jsonl"
+# Sessions file of older versions, a single JSON array rewritten on every quiz
+FILE_LEGACY_SESSIONS = "sessions.json"
+
+TIME_FORMAT = "%d.%m.%Y %H:%M:%S"
+
+# Score record of a vocable that has never been practiced (read-only)
+EMPTY_SCORE = MappingProxyType({
+    "score": 0,
+    "last_practiced": None,
+    "last_practiced_ts": None,
+    "last_correct": None
+})
+
+# Quiz directions: German to English and English to German
+DIRECTIONS = ("de_en", "en_de")
+
+# Minimum number of seconds between two regular flushes of dirty data
+FLUSH_INTERVAL = 5.0
+
+# Write indented JSON files for reading them by hand (larger and slower)
+PRETTY_JSON = False
+
+# Separators of compact JSON, without the default spaces after , and :
+COMPACT_SEPARATORS = (",", ":")
+
+# Encoders of the json fallback, created once and reused for every save
+JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=COMPACT_SEPARATORS)
+PRETTY_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=4)
+
+# Statistics categories, from score 1 on every category covers ten scores
+CATEGORIES = (
+    "unpracticed",    # score = 0
+    "beginner",       # 01-09
+    "learning",       # 10-19
+    "advanced",       # 20-29
+    "good",           # 30-39
+    "master"          # 40+
+)
+
+# Category labels in German
+CATEGORY_LABELS = {
+    "unpracticed": "Nicht geübt (0):",
+    "beginner": "Anfänger (01-09):",
+    "learning": "Lernend (10-19):",
+    "advanced": "Fortgeschritten (20-29):",
+    "good": "Gut (30-39):",
+    "master": "Meister (40+):"
+}
+
+# Frame of the statistics box
+BOX_TOP = "╔════════════════════════════════════════════════════════╗"
+BOX_SEPARATOR = "╠════════════════════════════════════════════════════════╣"
+BOX_BOTTOM = "╚════════════════════════════════════════════════════════╝"
+
+# Statistics box shown without any vocables, followed by an empty line
+EMPTY_STATISTICS_TEXT = (
+    "╔════════════════════════════════════════╗\n"
+    "║     Keine Vokabeln vorhanden          ║\n"
+    "╚════════════════════════════════════════╝\n"
+)
+
+# Main menu below the statistics
+MENU_TEXT = (
+    "----- Vokabeltrainer -----\n"
+    "1) Vokabeln hinzufügen\n"
+    "2) Quiz starten\n"
+    "3) Alle Vokabeln anzeigen\n"
+    "4) beenden"
+)
+
+# Progress bars of the statistics, indexed by the number of filled characters
+BAR_WIDTH = 10
+BARS = tuple(
+    "█" * filled + "░" * (BAR_WIDTH - filled) for filled in range(BAR_WIDTH + 1)
+)
+
+
+def read_json(path, default):
+    """
+    Read a JSON file, using orjson if it is installed.
+
+    Args:
+        path: Path of the JSON file
+        default: Value returned if the file does not exist
+
+    Returns:
+        Parsed content of the file, or default
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return default
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+@contextmanager
+def open_atomic(path, mode, **kwargs):
+    """
+    Open a temporary file that replaces path once the with block completes.
+
+    An interrupted write never leaves a truncated file behind, since path is
+    only replaced in one step after everything has been written. If the write
+    fails, the temporary file is removed and path stays unchanged.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+    except BaseException:
+        # Also on KeyboardInterrupt, so no .tmp file is left behind
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+def write_json(path, data):
+    """
+    Write data as compact JSON (indented if PRETTY_JSON is set), using orjson
+    if it is installed.
+
+    The file is replaced atomically (see open_atomic()). Non-string dictionary
+    keys (the int vocable IDs) are written as strings.
+    """
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS
+        if PRETTY_JSON:
+            option |= orjson.OPT_INDENT_2
+        with open_atomic(path, "wb") as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        encoder = PRETTY_JSON_ENCODER if PRETTY_JSON else JSON_ENCODER
+        with open_atomic(path, "w", encoding="utf-8") as f:
+            # Write the encoded chunks without joining them into one string
+            f.writelines(encoder.iterencode(data))
 
 
 def load_vocables():
-    if not os.path.exists(FILE_VOCABLES):
-        return []
-    with open(FILE_VOCABLES, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return read_json(FILE_VOCABLES, [])
 
 
 def save_vocables(vokabeln):
-    with open(FILE_VOCABLES, "w", encoding="utf-8") as f:
-        json.dump(vokabeln, f, ensure_ascii=False, indent=4)
+    write_json(FILE_VOCABLES, vokabeln)
 
 
 def load_scores():
-    if not os.path.exists(FILE_SCORES):
-        return {}
-    with open(FILE_SCORES, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # JSON object keys are strings, in memory scores are keyed by int ID
+    scores = {int(k): v for k, v in read_json(FILE_SCORES, {}).items()}
+
+    # Older score files only have the formatted date, add the epoch seconds once
+    upgraded = False
+    for score_data in scores.values():
+        if "last_practiced_ts" not in score_data:
+            last_practiced = score_data.get("last_practiced")
+            score_data["last_practiced_ts"] = (
+                None if last_practiced is None
+                else int(datetime.strptime(last_practiced, TIME_FORMAT).timestamp())
+            )
+            upgraded = True
+
+    # Save the upgraded records, so the dates are not parsed on every start
+    if upgraded:
+        mark_dirty("scores", scores)
+
+    return scores
 
 
 def save_scores(scores):
-    with open(FILE_SCORES, "w", encoding="utf-8") as f:
-        json.dump(scores, f, ensure_ascii=False, indent=4)
+    write_json(FILE_SCORES, scores)
+
+
+def iter_sessions():
+    """Yield all logged quiz sessions, oldest first."""
+    try:
+        with open(FILE_SESSIONS, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line) if orjson else json.loads(line)
+    except FileNotFoundError:
+        return
+
+
+def session_line(session):
+    """Encode a quiz session as one line of the sessions log."""
+    if orjson:
+        line = orjson.dumps(session)
+    else:
+        line = JSON_ENCODER.encode(session).encode("utf-8")
+    return line + b"\n"
+
+
+def append_session(session):
+    """Append a quiz session as one JSON line to the sessions log."""
+    with open(FILE_SESSIONS, "ab") as f:
+        f.write(session_line(session))
+
+
+def migrate_legacy_sessions():
+    """
+    Move the sessions of an old sessions.json into the sessions log.
+
+    The legacy sessions are older than any logged session, so they are written
+    first and the log is replaced in one step. The legacy file is removed last.
+    If the log already starts with the legacy sessions, an earlier migration
+    was interrupted before the removal and only the removal is repeated.
+    An unreadable legacy file is left untouched.
+    """
+    warning = f"Warnung: {FILE_LEGACY_SESSIONS} ist beschädigt und wird nicht übernommen.\n"
+
+    try:
+        legacy_sessions = read_json(FILE_LEGACY_SESSIONS, None)
+    except ValueError:
+        # Covers json.JSONDecodeError and orjson.JSONDecodeError
+        print(warning)
+        return
+
+    if legacy_sessions is None:
+        return
+    if not isinstance(legacy_sessions, list):
+        print(warning)
+        return
+
+    logged_sessions = list(iter_sessions())
+
+    if logged_sessions[:len(legacy_sessions)] != legacy_sessions:
+        with open_atomic(FILE_SESSIONS, "wb") as f:
+            for session in legacy_sessions + logged_sessions:
+                f.write(session_line(session))
+
+    os.remove(FILE_LEGACY_SESSIONS)
+
+
+# Data changed in memory but not yet written to disk, keyed by name
+_dirty: dict[str, Any] = {}
+_last_flush = time.monotonic()
+
+# Incremented on every change, used to invalidate cached results
+_data_version = 0
+
+
+def mark_dirty(name, data):
+    """Remember that the in-memory data called name has to be written to disk."""
+    global _data_version
+
+    _dirty[name] = data
+    _data_version += 1
+
+
+def flush_if_dirty(force=False):
+    """
+    Write all dirty data to disk.
+
+    Regular flushes happen at most every FLUSH_INTERVAL seconds, so a batch of
+    changes only rewrites each file once.
+
+    Args:
+        force: Flush immediately, regardless of the time since the last flush
+    """
+    global _last_flush
+
+    if not _dirty:
+        return
+    if not force and time.monotonic() - _last_flush < FLUSH_INTERVAL:
+        return
 
+    savers = {
+        "vocables": save_vocables,
+        "scores": save_scores
+    }
+    for name, data in _dirty.items():
+        savers[name](data)
 
-def load_sessions():
-    if not os.path.exists(FILE_SESSIONS):
-        return []
-    with open(FILE_SESSIONS, "r", encoding="utf-8") as f:
-        return json.load(f)
+    _dirty.clear()
+    _last_flush = time.monotonic()
 
 
-def save_sessions(sessions):
-    with open(FILE_SESSIONS, "w", encoding="utf-8") as f:
-        json.dump(sessions, f, ensure_ascii=False, indent=4)
+atexit.register(flush_if_dirty, force=True)
 
 
-def now():
-    return datetime.now().strftime("%d.%m.%Y %H:%M:%S")
+def now(seconds=None):
+    """Format epoch seconds (default: the current time) as local TIME_FORMAT date."""
+    return time.strftime(TIME_FORMAT, time.localtime(seconds))
 
 
 def init_scores(scores, vocable_id):
     """If scores is empty, initialize it with the current date and time."""
-    if str(vocable_id) not in scores:
-        scores[str(vocable_id)] = {
-            "score": 0,
-            "last_practiced": None,
-            "last_correct": None
-        }
+    if vocable_id not in scores:
+        scores[vocable_id] = dict(EMPTY_SCORE)
 
 
 def add_vocables(vocables, scores):
     print("Vokabeln hinzufügen (leere Eingabe bei 'english' zum Beenden)\n")
 
+    # Find the highest ID once, then count up for every added vocable
+    next_id = 1 if not vocables else max(v["id"] for v in vocables) + 1
+
     while True:
         english = input("english: ").strip()
 
@@ -74,8 +329,6 @@ def add_vocables(vocables, scores):
             print("Vokabeln hinzufügen beendet.\n")
             break
 
-        next_id = 1 if not vocables else max(v["id"] for v in vocables) + 1
-
         vocables.append({
             "id": next_id,
             "de": german,
@@ -83,16 +336,18 @@ def add_vocables(vocables, scores):
         })
 
         init_scores(scores, next_id)
+        next_id += 1
 
-        save_vocables(vocables)
-        save_scores(scores)
+        mark_dirty("vocables", vocables)
+        mark_dirty("scores", scores)
+        flush_if_dirty()
 
         print("✓ Vokabeln hinzugefügt!\n")
 
 
 def show_vocables(vocables, scores):
     for v in vocables:
-        s = scores.get(str(v["id"]), {})
+        s = scores.get(v["id"], EMPTY_SCORE)
         print(
             f"{v['de']} – {v['en']} "
             f"| Score: {s.get('score', 0)} "
@@ -102,27 +357,21 @@ def show_vocables(vocables, scores):
     print()
 
 
-def calculate_statistics():
+def calculate_statistics(vocables, scores):
     """
     Calculate vocabulary statistics grouped by score ranges.
 
+    Args:
+        vocables: List of all vocabulary items
+        scores: Dictionary of scores keyed by vocable ID
+
     Returns:
         Dictionary with total count and category breakdown with counts and percentages
     """
-    vocables = load_vocables()
-    scores = load_scores()
-
     total = len(vocables)
 
-    # Initialize counters for each category
-    categories = {
-        "unpracticed": 0,    # score = 0
-        "beginner": 0,       # 01-09
-        "learning": 0,       # 10-19
-        "advanced": 0,       # 20-29
-        "good": 0,           # 30-39
-        "master": 0          # 40+
-    }
+    # Initialize counters for each category, indexed like CATEGORIES
+    counts = [0] * len(CATEGORIES)
 
     # Initialize score statistics
     total_score = 0
@@ -131,9 +380,7 @@ def calculate_statistics():
 
     # Count vocables in each category and calculate score statistics
     for vocable in vocables:
-        vocable_id = str(vocable["id"])
-        score_data = scores.get(vocable_id, {"score": 0})
-        score = score_data.get("score", 0)
+        score = scores.get(vocable["id"], EMPTY_SCORE)["score"]
 
         # Update score statistics
         total_score += score
@@ -142,18 +389,8 @@ def calculate_statistics():
         if min_score is None or score < min_score:
             min_score = score
 
-        if score == 0:
-            categories["unpracticed"] += 1
-        elif 1 <= score <= 9:
-            categories["beginner"] += 1
-        elif 10 <= score <= 19:
-            categories["learning"] += 1
-        elif 20 <= score <= 29:
-            categories["advanced"] += 1
-        elif 30 <= score <= 39:
-            categories["good"] += 1
-        else:  # score > 40
-            categories["master"] += 1
+        # Category index: 0 for unpracticed, then one category per ten scores
+        counts[0 if score <= 0 else min(score // 10 + 1, len(CATEGORIES) - 1)] += 1
 
     # Calculate percentages
     stats = {
@@ -164,7 +401,7 @@ def calculate_statistics():
         "categories": {}
     }
 
-    for key, count in categories.items():
+    for key, count in zip(CATEGORIES, counts):
         percentage = round((count / total * 100)) if total > 0 else 0
         stats["categories"][key] = {
             "count": count,
@@ -174,80 +411,87 @@ def calculate_statistics():
     return stats
 
 
-def display_statistics_ascii(stats):
+def render_statistics_ascii(stats):
     """
-    Display vocabulary statistics as ASCII art with progress bars.
+    Render vocabulary statistics as ASCII art with progress bars.
 
     Args:
         stats: Dictionary with total and categories (from calculate_statistics())
+
+    Returns:
+        The statistics box as text for a single print()
     """
     total = stats["total"]
 
     # Handle empty database
     if total == 0:
-        print("╔════════════════════════════════════════╗")
-        print("║     Keine Vokabeln vorhanden          ║")
-        print("╚════════════════════════════════════════╝")
-        print()
-        return
+        return EMPTY_STATISTICS_TEXT
 
     # Find the maximum count for scaling bars
     max_count = max(cat["count"] for cat in stats["categories"].values())
-    bar_width = 10  # Number of characters for full bar
-
-    # Category labels in German
-    labels = {
-        "unpracticed": "Nicht geübt (0):",
-        "beginner": "Anfänger (01-09):",
-        "learning": "Lernend (10-19):",
-        "advanced": "Fortgeschritten (20-29):",
-        "good": "Gut (30-39):",
-        "master": "Meister (40+):"
-    }
 
-    # Print header
-    print()
-    print("╔════════════════════════════════════════════════════════╗")
+    lines = [""]
+
+    # Header
+    lines.append(BOX_TOP)
     title = f"Vokabeln Statistik (Total: {total})"
-    padding = (56 - len(title)) // 2
-    print(f"║{' ' * padding}{title}{' ' * (56 - len(title) - padding)}║")
-    print("╠════════════════════════════════════════════════════════╣")
+    lines.append(f"║{title:^56s}║")
+    lines.append(BOX_SEPARATOR)
 
-    # Display score summary statistics
+    # Score summary statistics
     total_score = stats.get("total_score", 0)
     max_score = stats.get("max_score", 0)
     min_score = stats.get("min_score", 0)
-    print(f"║ Gesamtpunktzahl: {total_score:>36d}  ║")
-    print(f"║ Höchste Punktzahl: {max_score:>34d}  ║")
-    print(f"║ Niedrigste Punktzahl: {min_score:>31d}  ║")
-    print("╠════════════════════════════════════════════════════════╣")
-
-    # Print each category
-    category_order = ["unpracticed", "beginner", "learning", "advanced", "good", "master"]
-    for key in category_order:
+    lines.append(f"║ Gesamtpunktzahl: {total_score:>36d}  ║")
+    lines.append(f"║ Höchste Punktzahl: {max_score:>34d}  ║")
+    lines.append(f"║ Niedrigste Punktzahl: {min_score:>31d}  ║")
+    lines.append(BOX_SEPARATOR)
+
+    # One line per category
+    for key in CATEGORIES:
         cat_data = stats["categories"][key]
         count = cat_data["count"]
         percentage = cat_data["percentage"]
 
         # Calculate bar length (scale to max_count)
         if max_count > 0:
-            filled = round((count / max_count) * bar_width)
+            filled = round((count / max_count) * BAR_WIDTH)
         else:
             filled = 0
-        empty = bar_width - filled
-
-        # Create progress bar
-        bar = "█" * filled + "░" * empty
 
         # Format label with padding
-        label = labels[key]
+        label = CATEGORY_LABELS[key]
 
-        # Print the line with proper formatting
+        # Add the line with proper formatting
         stats_str = f"{count:3d} ({percentage:3d}%)"
-        print(f"║ {label:26s} [{bar}] {stats_str:9s}     ║")
+        lines.append(f"║ {label:26s} [{BARS[filled]}] {stats_str:9s}     ║")
 
-    print("╚════════════════════════════════════════════════════════╝")
-    print()
+    lines.append(BOX_BOTTOM)
+    lines.append("")
+    return "\n".join(lines)
+
+
+# Rendered statistics of the current data as (data version, text)
+_statistics_text_cache: tuple[int, str] | None = None
+
+
+def get_statistics_text(vocables, scores):
+    """
+    Return the rendered statistics box, recalculated only after data changes.
+
+    Args:
+        vocables: List of all vocabulary items
+        scores: Dictionary of scores keyed by vocable ID
+
+    Returns:
+        Text from render_statistics_ascii() for the current data
+    """
+    global _statistics_text_cache
+
+    if _statistics_text_cache is None or _statistics_text_cache[0] != _data_version:
+        stats = calculate_statistics(vocables, scores)
+        _statistics_text_cache = (_data_version, render_statistics_ascii(stats))
+    return _statistics_text_cache[1]
 
 
 def select_vocables_by_priority(vocables, scores, count):
@@ -262,32 +506,30 @@ def select_vocables_by_priority(vocables, scores, count):
     Returns:
         List of selected vocables ordered by priority
     """
+    # Shuffle once, the position in the shuffled list breaks ties randomly
+    shuffled = list(vocables)
+    random.shuffle(shuffled)
+
     priority_list = []
 
-    for vocable in vocables:
-        vocable_id = str(vocable["id"])
-        init_scores(scores, vocable_id)
-        score_data = scores[vocable_id]
+    for position, vocable in enumerate(shuffled):
+        # Read-only access, scores are only created when a vocable is answered
+        score_data = scores.get(vocable["id"], EMPTY_SCORE)
 
         score = score_data["score"]
-        last_practiced = score_data["last_practiced"]
+        ts = score_data["last_practiced_ts"]
 
-        # Convert to sortable timestamp
-        if last_practiced is None:
-            ts = datetime.max  # Never practiced = lowest priority
-        else:
-            ts = datetime.strptime(last_practiced, "%d.%m.%Y %H:%M:%S")
+        if ts is None:
+            ts = sys.maxsize  # Never practiced = lowest priority
 
         # Create priority tuple: lower score = higher priority, older date = higher priority
-        priority_tuple = (score, ts, random.random(), vocable)
+        priority_tuple = (score, ts, position, vocable)
         priority_list.append(priority_tuple)
 
-    # Sort by priority (ascending: lowest score first, oldest practice first)
-    priority_list.sort()
-
-    # Select the requested number of vocables (or all if fewer available)
-    selected_count = min(count, len(priority_list))
-    selected = [item[3] for item in priority_list[:selected_count]]  # Extract vocable from tuple
+    # Select the requested number of vocables (or all if fewer available) with
+    # the highest priority (lowest score first, oldest practice first)
+    highest = heapq.nsmallest(count, priority_list)
+    selected = [item[3] for item in highest]  # Extract vocable from tuple
 
     return selected
 
@@ -312,26 +554,29 @@ def run_quiz_round(vocables, scores, selected_vocables):
 
     total_questions = len(selected_vocables)
 
-    for idx, vocable in enumerate(selected_vocables, 1):
+    # Draw the directions of all questions at once
+    directions = random.choices(DIRECTIONS, k=total_questions)
+
+    for idx, (vocable, direction) in enumerate(zip(selected_vocables, directions), 1):
         vocable_id = vocable["id"]
-        direction = random.choice(["de_en", "en_de"])
+        german = vocable["de"]
+        english = vocable["en"]
 
         print(f"\nFrage {idx}/{total_questions}")
 
         if direction == "de_en":
-            response = input(f"Was heißt '{vocable['de']}' auf Englisch? ").strip()
-            correct_answer = vocable["en"]
+            question, correct_answer, language = german, english, "Englisch"
         else:
-            response = input(f"Was heißt '{vocable['en']}' auf Deutsch? ").strip()
-            correct_answer = vocable["de"]
+            question, correct_answer, language = english, german, "Deutsch"
 
+        response = input(f"Was heißt '{question}' auf {language}? ").strip()
         was_correct = (response == correct_answer)
 
         # Store detailed result
         result = {
             "vocable_id": vocable_id,
-            "german": vocable["de"],
-            "english": vocable["en"],
+            "german": german,
+            "english": english,
             "direction": direction,
             "user_answer": response,
             "correct_answer": correct_answer,
@@ -350,31 +595,35 @@ def run_quiz_round(vocables, scores, selected_vocables):
     return results
 
 
-def update_scores_from_results(scores, results):
+def update_scores_from_results(scores, results, current_ts):
     """
-    Update scores and timestamps based on quiz round results.
+    Update scores and timestamps based on quiz round results and mark them for saving.
 
     Args:
         scores: Current scores dictionary
         results: Results from run_quiz_round()
+        current_ts: Time of the round as epoch seconds, used for all results
 
     Returns:
         Updated scores dictionary
     """
-    current_time = now()
+    current_time = now(current_ts)
 
     for result in results["results"]:
-        vocable_id = str(result["vocable_id"])
+        vocable_id = result["vocable_id"]
         init_scores(scores, vocable_id)
 
         # Update last_practiced for all vocables
         scores[vocable_id]["last_practiced"] = current_time
+        scores[vocable_id]["last_practiced_ts"] = current_ts
 
         # If correct, increment score and update last_correct
         if result["was_correct"]:
             scores[vocable_id]["score"] += 1
             scores[vocable_id]["last_correct"] = current_time
 
+    mark_dirty("scores", scores)
+
     return scores
 
 
@@ -385,28 +634,39 @@ def display_quiz_results(results):
     Args:
         results: Results dictionary from run_quiz_round()
     """
-    print("\n" + "=" * 50)
-    print("Quiz abgeschlossen!")
-    print("=" * 50)
-    print(f"Ergebnis: {results['correct']}/{results['total']} richtig\n")
+    # Split the results into correct and incorrect answers in one pass
+    correct_results = []
+    incorrect_results = []
+    for r in results["results"]:
+        (correct_results if r["was_correct"] else incorrect_results).append(r)
+
+    # Collect all lines and print them at once
+    lines = [
+        "",
+        "=" * 50,
+        "Quiz abgeschlossen!",
+        "=" * 50,
+        f"Ergebnis: {results['correct']}/{results['total']} richtig",
+        ""
+    ]
 
     # Show correct answers
-    correct_results = [r for r in results["results"] if r["was_correct"]]
     if correct_results:
-        print("✓ Richtige Antworten:")
+        lines.append("✓ Richtige Antworten:")
         for r in correct_results:
-            print(f"  • {r['german']} - {r['english']}")
-        print()
+            lines.append(f"  • {r['german']} - {r['english']}")
+        lines.append("")
 
     # Show incorrect answers with details
-    incorrect_results = [r for r in results["results"] if not r["was_correct"]]
     if incorrect_results:
-        print("✗ Falsche Antworten:")
+        lines.append("✗ Falsche Antworten:")
         for r in incorrect_results:
-            print(f"  • {r['german']} - {r['english']}")
-            print(f"    Deine Antwort: {r['user_answer']}")
-            print(f"    Richtig wäre: {r['correct_answer']}")
-        print()
+            lines.append(f"  • {r['german']} - {r['english']}")
+            lines.append(f"    Deine Antwort: {r['user_answer']}")
+            lines.append(f"    Richtig wäre: {r['correct_answer']}")
+        lines.append("")
+
+    print("\n".join(lines))
 
 
 def quiz(vocables, scores):
@@ -438,41 +698,35 @@ def quiz(vocables, scores):
     # Run the quiz round
     results = run_quiz_round(vocables, scores, selected_vocables)
 
-    # Update scores based on results
-    update_scores_from_results(scores, results)
+    # Read the clock once, scores and session share the same time
+    current_ts = int(time.time())
 
-    # Save updated scores
-    save_scores(scores)
+    # Update scores based on results
+    update_scores_from_results(scores, results, current_ts)
 
     # Save session data
-    sessions = load_sessions()
     session = {
-        "timestamp": now(),
+        "timestamp": now(current_ts),
         "total": results["total"],
         "correct": results["correct"],
         "results": results["results"]
     }
-    sessions.append(session)
-    save_sessions(sessions)
+    append_session(session)
 
     # Display detailed results
     display_quiz_results(results)
 
 
 def menu():
+    migrate_legacy_sessions()
     vocables = load_vocables()
     scores = load_scores()
 
     while True:
-        # Display statistics
-        stats = calculate_statistics()
-        display_statistics_ascii(stats)
+        # Display statistics, only rendered again after changes
+        print(get_statistics_text(vocables, scores))
 
-        print("----- Vokabeltrainer -----")
-        print("1) Vokabeln hinzufügen")
-        print("2) Quiz starten")
-        print("3) Alle Vokabeln anzeigen")
-        print("4) beenden")
+        print(MENU_TEXT)
 
         auswahl = input("Auswahl: ").strip()
 
@@ -483,11 +737,15 @@ def menu():
         elif auswahl == "3":
             show_vocables(vocables, scores)
         elif auswahl == "4":
+            flush_if_dirty(force=True)
             print("Bis Bald!")
             break
         else:
             print("Ungültige auswahl.\n")
 
+        # Write the changes of the finished action
+        flush_if_dirty(force=True)
+
 
 if __name__ == "__main__":
     menu()